@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Shared configuration for the Supabase storage test scripts
+Reads /app/.env once per process; real environment variables take precedence
+"""
+
+import os
+import re
+import functools
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+ENV_PATH = '/app/.env'
+# KEY=value lines, ignoring blanks and comments; surrounding whitespace is dropped
+_ENV_LINE = re.compile(r'^[ \t]*([^#\s=][^=\n]*)=(.*?)[ \t\r]*$', re.MULTILINE)
+
+@functools.lru_cache(maxsize=1)
+def _parse_env_file(path, mtime):
+    """Parse a .env file in one pass; cached until the file's mtime changes"""
+    with open(path, 'r') as f:
+        return dict(_ENV_LINE.findall(f.read()))
+
+def load_env_vars():
+    try:
+        return _parse_env_file(ENV_PATH, os.path.getmtime(ENV_PATH))
+    except Exception as e:
+        print(f"Error loading .env file: {e}")
+        return {}
+
+env_vars = load_env_vars() | os.environ
+
+# Supabase configuration
+SUPABASE_URL = env_vars.get('NEXT_PUBLIC_SUPABASE_URL')
+SUPABASE_ANON_KEY = env_vars.get('NEXT_PUBLIC_SUPABASE_ANON_KEY')
+
+# (connect, read) seconds, so a stuck Supabase endpoint can't stall the run
+REQUEST_TIMEOUT = (3.0, 10.0)
+# Transient gateway errors are retried with backoff before a check is failed
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(['GET', 'HEAD', 'POST']),
+    raise_on_status=False,
+)
+
+def make_session(pool_connections=10, pool_maxsize=10):
+    """Return a pooled Session with RETRY_POLICY mounted and REQUEST_TIMEOUT as the default timeout"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=RETRY_POLICY)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.request = functools.partial(session.request, timeout=REQUEST_TIMEOUT)
+    return session
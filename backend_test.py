@@ -6,16 +6,50 @@ Tests Supabase integration and all API endpoints
 
 import requests
 import json
+import functools
 import uuid
 import time
 import io
+import sys
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configuration - Use environment variable for base URL
 import os
 BASE_URL = os.getenv('NEXT_PUBLIC_BASE_URL', 'http://localhost:3000') + '/api'
 
+# Default (connect, read) timeout so a stalled request cannot block the suite
+REQUEST_TIMEOUT = (5, 30)
+# Tighter timeout for the reachability check that gates the whole run
+GATE_TIMEOUT = (2, 5)
+
+# Optional pause between tests, for rate-limited remote deployments; when
+# set, the tests run one at a time so the pause actually spaces requests
+try:
+    INTER_TEST_DELAY_MS = int(os.getenv('INTER_TEST_DELAY_MS', '0'))
+except ValueError:
+    print(f"⚠️  Ignoring invalid INTER_TEST_DELAY_MS={os.getenv('INTER_TEST_DELAY_MS')!r}")
+    INTER_TEST_DELAY_MS = 0
+
+# Cap on how much of a failing response body is copied into a log message
+FAILURE_BODY_CHARS = 500
+
+# The API sends these on every response, not only on OPTIONS preflights
+CORS_HEADERS = (
+    'Access-Control-Allow-Origin',
+    'Access-Control-Allow-Methods',
+    'Access-Control-Allow-Headers'
+)
+
+# Each result is appended here as one JSON line as soon as it is logged;
+# the summary keeps only the counts
+RESULTS_JSONL_PATH = '/app/test_results.jsonl'
+
 # Test data
 TEST_USER_ID = str(uuid.uuid4())
 TEST_USER_DATA = {
@@ -50,490 +84,583 @@ TEST_ISSUE_WITH_IMAGE_DATA = {
     "image_url": "https://example.com/test-image.jpg"  # This will be updated with actual Supabase URL
 }
 
+TEST_ISSUE_WITHOUT_IMAGE_DATA = {
+    "user_id": TEST_USER_ID,
+    "description": "Garbage accumulation near the community center entrance. Multiple bags left unattended for several days attracting stray animals.",
+    "category": "Garbage",
+    "location": "Community Center Entrance, Test City",
+    "coordinates": {
+        "lat": 28.6139,
+        "lng": 77.2090
+    }
+    # No image_url field
+}
+
+# Request bodies are constant, encode them once instead of on every POST
+TEST_USER_BODY = json.dumps(TEST_USER_DATA)
+TEST_ISSUE_BODY = json.dumps(TEST_ISSUE_DATA)
+TEST_ISSUE_WITH_IMAGE_BODY = json.dumps(TEST_ISSUE_WITH_IMAGE_DATA)
+TEST_ISSUE_WITHOUT_IMAGE_BODY = json.dumps(TEST_ISSUE_WITHOUT_IMAGE_DATA)
+STATUS_UPDATE_BODY = json.dumps({"status": "Acknowledged"})
+MISSING_FIELDS_USER_BODY = json.dumps({"name": "Test"})
+
+@dataclass(slots=True)
+class TestResult:
+    """One logged test outcome; ts_ns is nanoseconds since the tester started"""
+    __test__ = False  # not a pytest test class
+
+    test: str
+    success: bool
+    message: str
+    ts_ns: int
+    response_data: object = None
+
+def log_exceptions(name):
+    """Log an exception escaping the decorated test as a failure of the named test"""
+    def decorator(test):
+        @functools.wraps(test)
+        def wrapper(self):
+            try:
+                return test(self)
+            except Exception as e:
+                self.log_test(name, False, f"Exception: {str(e)}")
+                return False
+        return wrapper
+    return decorator
+
 class CivicReporterAPITester:
     def __init__(self):
         self.base_url = BASE_URL
+        # Endpoint URLs are fixed for the run, format them once
+        self.url_root = f"{BASE_URL}/"
+        self.url_health = f"{BASE_URL}/health"
+        self.url_issues = f"{BASE_URL}/issues"
+        self.url_users = f"{BASE_URL}/users"
+        self.url_invalid_route = f"{BASE_URL}/invalid-route"
+        self.url_invalid_issue = f"{BASE_URL}/issues/invalid-id"
+        # Set once the corresponding issue has been created
+        self.url_issue_created = None
+        self.url_issue_with_image_created = None
         self.session = requests.Session()
+        # Reuse kept-alive connections across all tests; idempotent requests
+        # are retried briefly on gateway errors from a remote deployment
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504), raise_on_status=False),
+            pool_block=False
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.request = functools.partial(self.session.request, timeout=REQUEST_TIMEOUT)
         self.session.headers.update({
             'Content-Type': 'application/json',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Connection': 'keep-alive'
         })
         self.created_issue_id = None
         self.created_issue_with_image_id = None
-        self.test_results = []
+        self._cors_checked = False
+        self._passed = 0
+        self._total = 0
+        self._lock = threading.Lock()
+        # Per-test log lines are collected here and written out in one go
+        # at the end of run_all_tests
+        self._log_buf = io.StringIO()
+        self._results_file = open(RESULTS_JSONL_PATH, 'w')
+        # url -> (fetched_at, response) for short-lived GET reuse
+        self._get_cache = {}
+        # Log entries carry a monotonic offset; the summary records this
+        # wall-clock anchor once
+        self._t0_wall = datetime.now()
+        self._t0_mono = time.monotonic_ns()
 
     def log_test(self, test_name, success, message, response_data=None):
         """Log test results"""
-        result = {
-            'test': test_name,
-            'success': success,
-            'message': message,
-            'timestamp': datetime.now().isoformat(),
-            'response_data': response_data
-        }
-        self.test_results.append(result)
+        result = TestResult(test_name, success, message, time.monotonic_ns() - self._t0_mono, response_data)
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}: {message}")
-        if response_data and not success:
-            print(f"   Response: {json.dumps(response_data, indent=2)}")
+        # Independent tests log from worker threads
+        with self._lock:
+            self._passed += success
+            self._total += 1
+            self._results_file.write(json.dumps(asdict(result)) + '\n')
+            self._results_file.flush()
+            print(f"{status} {test_name}: {message}", file=self._log_buf)
+            if response_data and not success:
+                print(f"   Response: {json.dumps(response_data, indent=2)}", file=self._log_buf)
+
+    def _fail(self, test_name, response):
+        """Log an HTTP failure, decoding (and truncating) the body only here"""
+        # Decode explicitly rather than via response.text, which falls back
+        # to charset detection when the server omits a charset
+        body = response.content[:FAILURE_BODY_CHARS].decode('utf-8', errors='replace')
+        self.log_test(test_name, False, f"HTTP {response.status_code}: {body}")
+
+    def _missing_cors_headers(self, headers):
+        """Return the required CORS headers absent from a response"""
+        return [header for header in CORS_HEADERS if header not in headers]
+
+    def cached_get(self, url, ttl=5.0, **kwargs):
+        """GET url, reusing a response fetched within the last ttl seconds"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._get_cache.get(url)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        response = self.session.get(url, **kwargs)
+        with self._lock:
+            self._get_cache[url] = (now, response)
+        return response
+
+    def _gather(self, *calls):
+        """Run independent request callables concurrently, returning results in order"""
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            return list(executor.map(lambda call: call(), calls))
 
+    def _json(self, response):
+        """Decode a JSON response body straight from its bytes"""
+        return json.loads(response.content)
+
+    @log_exceptions("Root Endpoint")
     def test_root_endpoint(self):
         """Test GET /api/ - Health check and API info"""
-        try:
-            response = self.session.get(f"{self.base_url}/")
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'message' in data and 'endpoints' in data:
-                    self.log_test("Root Endpoint", True, f"API info retrieved successfully. Message: {data['message']}")
-                    return True
-                else:
-                    self.log_test("Root Endpoint", False, "Response missing required fields", data)
-                    return False
+        response = self.cached_get(self.url_root)
+        
+        if response.status_code == 200:
+            data = self._json(response)
+            if 'message' in data and 'endpoints' in data:
+                # Let test_cors_headers reuse this response instead of a preflight
+                if not self._missing_cors_headers(response.headers):
+                    self._cors_checked = True
+                self.log_test("Root Endpoint", True, f"API info retrieved successfully. Message: {data['message']}")
+                return True
             else:
-                self.log_test("Root Endpoint", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Root Endpoint", False, "Response missing required fields", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Root Endpoint", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Root Endpoint", response)
             return False
 
+    @log_exceptions("Health Endpoint")
     def test_health_endpoint(self):
         """Test GET /api/health - Health status"""
-        try:
-            response = self.session.get(f"{self.base_url}/health")
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == 'healthy' and 'timestamp' in data:
-                    self.log_test("Health Endpoint", True, f"Health check passed. Status: {data['status']}")
-                    return True
-                else:
-                    self.log_test("Health Endpoint", False, "Health check response invalid", data)
-                    return False
+        response = self.cached_get(self.url_health)
+        
+        if response.status_code == 200:
+            data = self._json(response)
+            if data.get('status') == 'healthy' and 'timestamp' in data:
+                self.log_test("Health Endpoint", True, f"Health check passed. Status: {data['status']}")
+                return True
             else:
-                self.log_test("Health Endpoint", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Health Endpoint", False, "Health check response invalid", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Health Endpoint", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Health Endpoint", response)
             return False
 
+    @log_exceptions("Get Issues (Empty)")
     def test_get_issues_empty(self):
         """Test GET /api/issues - Should return empty array initially"""
-        try:
-            response = self.session.get(f"{self.base_url}/issues")
-            
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    self.log_test("Get Issues (Empty)", True, f"Retrieved {len(data)} issues successfully")
-                    return True
-                else:
-                    self.log_test("Get Issues (Empty)", False, "Response is not an array", data)
-                    return False
+        response = self.cached_get(self.url_issues)
+        
+        if response.status_code == 200:
+            data = self._json(response)
+            if isinstance(data, list):
+                self.log_test("Get Issues (Empty)", True, f"Retrieved {len(data)} issues successfully")
+                return True
             else:
-                self.log_test("Get Issues (Empty)", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Get Issues (Empty)", False, "Response is not an array", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Get Issues (Empty)", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Get Issues (Empty)", response)
             return False
 
+    @log_exceptions("Get Users (Empty)")
     def test_get_users_empty(self):
         """Test GET /api/users - Should return empty array initially"""
-        try:
-            response = self.session.get(f"{self.base_url}/users")
-            
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    self.log_test("Get Users (Empty)", True, f"Retrieved {len(data)} users successfully")
-                    return True
-                else:
-                    self.log_test("Get Users (Empty)", False, "Response is not an array", data)
-                    return False
+        response = self.cached_get(self.url_users)
+        
+        if response.status_code == 200:
+            data = self._json(response)
+            if isinstance(data, list):
+                self.log_test("Get Users (Empty)", True, f"Retrieved {len(data)} users successfully")
+                return True
             else:
-                self.log_test("Get Users (Empty)", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Get Users (Empty)", False, "Response is not an array", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Get Users (Empty)", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Get Users (Empty)", response)
             return False
 
+    @log_exceptions("Create User")
     def test_create_user(self):
         """Test POST /api/users - Create a test user profile"""
-        try:
-            response = self.session.post(
-                f"{self.base_url}/users",
-                json=TEST_USER_DATA
-            )
-            
-            if response.status_code == 201:
-                data = response.json()
-                if data.get('id') == TEST_USER_ID and data.get('name') == TEST_USER_DATA['name']:
-                    self.log_test("Create User", True, f"User created successfully with ID: {data['id']}")
-                    return True
-                else:
-                    self.log_test("Create User", False, "User data mismatch in response", data)
-                    return False
+        response = self.session.post(
+            self.url_users,
+            data=TEST_USER_BODY
+        )
+        
+        if response.status_code == 201:
+            data = self._json(response)
+            if data.get('id') == TEST_USER_ID and data.get('name') == TEST_USER_DATA['name']:
+                self.log_test("Create User", True, f"User created successfully with ID: {data['id']}")
+                return True
             else:
-                self.log_test("Create User", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Create User", False, "User data mismatch in response", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Create User", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Create User", response)
             return False
 
+    @log_exceptions("Create Issue")
     def test_create_issue(self):
         """Test POST /api/issues - Create a test issue"""
-        try:
-            response = self.session.post(
-                f"{self.base_url}/issues",
-                json=TEST_ISSUE_DATA
-            )
-            
-            if response.status_code == 201:
-                data = response.json()
-                if data.get('user_id') == TEST_USER_ID and data.get('description') == TEST_ISSUE_DATA['description']:
-                    self.created_issue_id = data.get('id')
-                    self.log_test("Create Issue", True, f"Issue created successfully with ID: {self.created_issue_id}")
-                    return True
-                else:
-                    self.log_test("Create Issue", False, "Issue data mismatch in response", data)
-                    return False
+        response = self.session.post(
+            self.url_issues,
+            data=TEST_ISSUE_BODY
+        )
+        
+        if response.status_code == 201:
+            data = self._json(response)
+            if data.get('user_id') == TEST_USER_ID and data.get('description') == TEST_ISSUE_DATA['description']:
+                self.created_issue_id = data.get('id')
+                self.url_issue_created = f"{self.url_issues}/{self.created_issue_id}"
+                self.log_test("Create Issue", True, f"Issue created successfully with ID: {self.created_issue_id}")
+                return True
             else:
-                self.log_test("Create Issue", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Create Issue", False, "Issue data mismatch in response", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Create Issue", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Create Issue", response)
             return False
 
+    @log_exceptions("Get Specific Issue")
     def test_get_specific_issue(self):
         """Test GET /api/issues/[issueId] - Fetch specific issue by ID"""
         if not self.created_issue_id:
             self.log_test("Get Specific Issue", False, "No issue ID available (create issue test failed)")
             return False
             
-        try:
-            response = self.session.get(f"{self.base_url}/issues/{self.created_issue_id}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('id') == self.created_issue_id and data.get('description') == TEST_ISSUE_DATA['description']:
-                    # Check if user data is included via join
-                    user_data = data.get('users')
-                    if user_data and user_data.get('name') == TEST_USER_DATA['name']:
-                        self.log_test("Get Specific Issue", True, f"Issue retrieved with user data. Status: {data.get('status')}")
-                        return True
-                    else:
-                        self.log_test("Get Specific Issue", True, f"Issue retrieved successfully. Status: {data.get('status')}")
-                        return True
+        response = self.session.get(self.url_issue_created)
+        
+        if response.status_code == 200:
+            data = self._json(response)
+            if data.get('id') == self.created_issue_id and data.get('description') == TEST_ISSUE_DATA['description']:
+                # Check if user data is included via join
+                user_data = data.get('users')
+                if user_data and user_data.get('name') == TEST_USER_DATA['name']:
+                    self.log_test("Get Specific Issue", True, f"Issue retrieved with user data. Status: {data.get('status')}")
+                    return True
                 else:
-                    self.log_test("Get Specific Issue", False, "Issue data mismatch", data)
-                    return False
+                    self.log_test("Get Specific Issue", True, f"Issue retrieved successfully. Status: {data.get('status')}")
+                    return True
             else:
-                self.log_test("Get Specific Issue", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Get Specific Issue", False, "Issue data mismatch", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Get Specific Issue", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Get Specific Issue", response)
             return False
 
+    @log_exceptions("Update Issue Status")
     def test_update_issue_status(self):
         """Test PUT /api/issues/[issueId] - Update issue status"""
         if not self.created_issue_id:
             self.log_test("Update Issue Status", False, "No issue ID available (create issue test failed)")
             return False
             
-        try:
-            update_data = {"status": "Acknowledged"}
-            response = self.session.put(
-                f"{self.base_url}/issues/{self.created_issue_id}",
-                json=update_data
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == 'Acknowledged':
-                    self.log_test("Update Issue Status", True, f"Issue status updated to: {data.get('status')}")
-                    return True
-                else:
-                    self.log_test("Update Issue Status", False, "Status not updated correctly", data)
-                    return False
+        response = self.session.put(
+            self.url_issue_created,
+            data=STATUS_UPDATE_BODY
+        )
+        
+        if response.status_code == 200:
+            data = self._json(response)
+            if data.get('status') == 'Acknowledged':
+                self.log_test("Update Issue Status", True, f"Issue status updated to: {data.get('status')}")
+                return True
             else:
-                self.log_test("Update Issue Status", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Update Issue Status", False, "Status not updated correctly", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Update Issue Status", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Update Issue Status", response)
             return False
 
+    @log_exceptions("CORS Headers")
     def test_cors_headers(self):
         """Test CORS headers are present"""
-        try:
-            response = self.session.options(f"{self.base_url}/")
+        if self._cors_checked:
+            self.log_test("CORS Headers", True, "All required CORS headers present")
+            return True
+        
+        response = self.session.options(self.url_root)
+        
+        if response.status_code == 200:
+            missing_headers = self._missing_cors_headers(response.headers)
             
-            if response.status_code == 200:
-                cors_headers = [
-                    'Access-Control-Allow-Origin',
-                    'Access-Control-Allow-Methods',
-                    'Access-Control-Allow-Headers'
-                ]
-                
-                missing_headers = []
-                for header in cors_headers:
-                    if header not in response.headers:
-                        missing_headers.append(header)
-                
-                if not missing_headers:
-                    self.log_test("CORS Headers", True, "All required CORS headers present")
-                    return True
-                else:
-                    self.log_test("CORS Headers", False, f"Missing CORS headers: {missing_headers}")
-                    return False
+            if not missing_headers:
+                self.log_test("CORS Headers", True, "All required CORS headers present")
+                return True
             else:
-                self.log_test("CORS Headers", False, f"OPTIONS request failed: HTTP {response.status_code}")
+                self.log_test("CORS Headers", False, f"Missing CORS headers: {missing_headers}")
                 return False
-                
-        except Exception as e:
-            self.log_test("CORS Headers", False, f"Exception: {str(e)}")
+        else:
+            self.log_test("CORS Headers", False, f"OPTIONS request failed: HTTP {response.status_code}")
             return False
 
+    @log_exceptions("Error Handling")
     def test_error_handling(self):
         """Test error handling for invalid requests"""
-        try:
-            # Test invalid route
-            response = self.session.get(f"{self.base_url}/invalid-route")
-            if response.status_code == 404:
-                self.log_test("Error Handling (404)", True, "Invalid route returns 404 correctly")
-            else:
-                self.log_test("Error Handling (404)", False, f"Expected 404, got {response.status_code}")
-                
-            # Test invalid issue ID
-            response = self.session.get(f"{self.base_url}/issues/invalid-id")
-            if response.status_code == 404:
-                self.log_test("Error Handling (Invalid ID)", True, "Invalid issue ID returns 404 correctly")
-            else:
-                self.log_test("Error Handling (Invalid ID)", False, f"Expected 404, got {response.status_code}")
-                
-            # Test missing required fields for user creation
-            response = self.session.post(f"{self.base_url}/users", json={"name": "Test"})
-            if response.status_code == 400:
-                self.log_test("Error Handling (Missing Fields)", True, "Missing required fields returns 400 correctly")
-                return True
-            else:
-                self.log_test("Error Handling (Missing Fields)", False, f"Expected 400, got {response.status_code}")
-                return False
-                
-        except Exception as e:
-            self.log_test("Error Handling", False, f"Exception: {str(e)}")
+        # The three probes share nothing, so send them together
+        invalid_route, invalid_id, missing_fields = self._gather(
+            lambda: self.session.get(self.url_invalid_route),
+            lambda: self.session.get(self.url_invalid_issue),
+            lambda: self.session.post(self.url_users, data=MISSING_FIELDS_USER_BODY)
+        )
+        
+        # Test invalid route
+        response = invalid_route
+        if response.status_code == 404:
+            self.log_test("Error Handling (404)", True, "Invalid route returns 404 correctly")
+        else:
+            self.log_test("Error Handling (404)", False, f"Expected 404, got {response.status_code}")
+            
+        # Test invalid issue ID
+        response = invalid_id
+        if response.status_code == 404:
+            self.log_test("Error Handling (Invalid ID)", True, "Invalid issue ID returns 404 correctly")
+        else:
+            self.log_test("Error Handling (Invalid ID)", False, f"Expected 404, got {response.status_code}")
+            
+        # Test missing required fields for user creation
+        response = missing_fields
+        if response.status_code == 400:
+            self.log_test("Error Handling (Missing Fields)", True, "Missing required fields returns 400 correctly")
+            return True
+        else:
+            self.log_test("Error Handling (Missing Fields)", False, f"Expected 400, got {response.status_code}")
             return False
 
+    @log_exceptions("Create Issue with Image")
     def test_create_issue_with_image(self):
         """Test POST /api/issues - Create issue with image URL"""
-        try:
-            response = self.session.post(
-                f"{self.base_url}/issues",
-                json=TEST_ISSUE_WITH_IMAGE_DATA
-            )
-            
-            if response.status_code == 201:
-                data = response.json()
-                if (data.get('user_id') == TEST_USER_ID and 
-                    data.get('description') == TEST_ISSUE_WITH_IMAGE_DATA['description'] and
-                    data.get('image_url') == TEST_ISSUE_WITH_IMAGE_DATA['image_url']):
-                    self.created_issue_with_image_id = data.get('id')
-                    self.log_test("Create Issue with Image", True, f"Issue with image created successfully. ID: {self.created_issue_with_image_id}")
-                    return True
-                else:
-                    self.log_test("Create Issue with Image", False, "Issue data mismatch in response", data)
-                    return False
+        response = self.session.post(
+            self.url_issues,
+            data=TEST_ISSUE_WITH_IMAGE_BODY
+        )
+        
+        if response.status_code == 201:
+            data = self._json(response)
+            if (data.get('user_id') == TEST_USER_ID and 
+                data.get('description') == TEST_ISSUE_WITH_IMAGE_DATA['description'] and
+                data.get('image_url') == TEST_ISSUE_WITH_IMAGE_DATA['image_url']):
+                self.created_issue_with_image_id = data.get('id')
+                self.url_issue_with_image_created = f"{self.url_issues}/{self.created_issue_with_image_id}"
+                self.log_test("Create Issue with Image", True, f"Issue with image created successfully. ID: {self.created_issue_with_image_id}")
+                return True
             else:
-                self.log_test("Create Issue with Image", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Create Issue with Image", False, "Issue data mismatch in response", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Create Issue with Image", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Create Issue with Image", response)
             return False
 
+    @log_exceptions("Create Issue without Image")
     def test_create_issue_without_image(self):
         """Test POST /api/issues - Create issue without image (graceful fallback)"""
-        try:
-            # Test data without image_url
-            issue_data_no_image = {
-                "user_id": TEST_USER_ID,
-                "description": "Garbage accumulation near the community center entrance. Multiple bags left unattended for several days attracting stray animals.",
-                "category": "Garbage",
-                "location": "Community Center Entrance, Test City",
-                "coordinates": {
-                    "lat": 28.6139,
-                    "lng": 77.2090
-                }
-                # No image_url field
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/issues",
-                json=issue_data_no_image
-            )
-            
-            if response.status_code == 201:
-                data = response.json()
-                if (data.get('user_id') == TEST_USER_ID and 
-                    data.get('description') == issue_data_no_image['description'] and
-                    data.get('image_url') is None):  # Should be None when no image
-                    self.log_test("Create Issue without Image", True, f"Issue without image created successfully. ID: {data.get('id')}")
-                    return True
-                else:
-                    self.log_test("Create Issue without Image", False, "Issue data mismatch in response", data)
-                    return False
+        response = self.session.post(
+            self.url_issues,
+            data=TEST_ISSUE_WITHOUT_IMAGE_BODY
+        )
+        
+        if response.status_code == 201:
+            data = self._json(response)
+            if (data.get('user_id') == TEST_USER_ID and 
+                data.get('description') == TEST_ISSUE_WITHOUT_IMAGE_DATA['description'] and
+                data.get('image_url') is None):  # Should be None when no image
+                self.log_test("Create Issue without Image", True, f"Issue without image created successfully. ID: {data.get('id')}")
+                return True
             else:
-                self.log_test("Create Issue without Image", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Create Issue without Image", False, "Issue data mismatch in response", data)
                 return False
-                
-        except Exception as e:
-            self.log_test("Create Issue without Image", False, f"Exception: {str(e)}")
+        else:
+            self._fail("Create Issue without Image", response)
             return False
 
+    @log_exceptions("Image URL Storage/Retrieval")
     def test_image_url_storage_and_retrieval(self):
         """Test that image URLs are properly stored and retrieved"""
         if not self.created_issue_with_image_id:
             self.log_test("Image URL Storage/Retrieval", False, "No issue with image ID available")
             return False
             
-        try:
-            # Fetch the issue and verify image URL is stored
-            response = self.session.get(f"{self.base_url}/issues/{self.created_issue_with_image_id}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                image_url = data.get('image_url')
-                
-                if image_url and image_url == TEST_ISSUE_WITH_IMAGE_DATA['image_url']:
-                    self.log_test("Image URL Storage/Retrieval", True, f"Image URL properly stored and retrieved: {image_url}")
-                    return True
-                else:
-                    self.log_test("Image URL Storage/Retrieval", False, f"Image URL mismatch. Expected: {TEST_ISSUE_WITH_IMAGE_DATA['image_url']}, Got: {image_url}")
-                    return False
-            else:
-                self.log_test("Image URL Storage/Retrieval", False, f"Failed to fetch issue: HTTP {response.status_code}")
-                return False
-                
-        except Exception as e:
-            self.log_test("Image URL Storage/Retrieval", False, f"Exception: {str(e)}")
+        # Read the row back: the create test already checked the echoed
+        # value, this checks what was actually persisted
+        response = self.session.get(self.url_issue_with_image_created)
+        if response.status_code != 200:
+            self.log_test("Image URL Storage/Retrieval", False, f"Failed to fetch issue: HTTP {response.status_code}")
+            return False
+        data = self._json(response)
+        
+        image_url = data.get('image_url')
+        if image_url and image_url == TEST_ISSUE_WITH_IMAGE_DATA['image_url']:
+            self.log_test("Image URL Storage/Retrieval", True, f"Image URL properly stored and retrieved: {image_url}")
+            return True
+        else:
+            self.log_test("Image URL Storage/Retrieval", False, f"Image URL mismatch. Expected: {TEST_ISSUE_WITH_IMAGE_DATA['image_url']}, Got: {image_url}")
             return False
 
+    @log_exceptions("Backward Compatibility")
     def test_backward_compatibility(self):
         """Test that existing API endpoints still work after image upload changes"""
-        try:
-            # Test all existing endpoints are still functional
-            endpoints_to_test = [
-                ("/", "GET", None),
-                ("/health", "GET", None),
-                ("/issues", "GET", None),
-                ("/users", "GET", None)
-            ]
-            
-            all_passed = True
-            for endpoint, method, data in endpoints_to_test:
-                try:
-                    if method == "GET":
-                        response = self.session.get(f"{self.base_url}{endpoint}")
-                    elif method == "POST":
-                        response = self.session.post(f"{self.base_url}{endpoint}", json=data)
-                    
-                    if response.status_code not in [200, 201]:
-                        all_passed = False
-                        self.log_test("Backward Compatibility", False, f"Endpoint {endpoint} failed with status {response.status_code}")
-                        break
-                        
-                except Exception as e:
-                    all_passed = False
-                    self.log_test("Backward Compatibility", False, f"Endpoint {endpoint} failed with exception: {str(e)}")
-                    break
+        # Test all existing endpoints are still functional; the GETs are
+        # independent, so issue them as one concurrent batch
+        endpoints_to_test = [
+            ("/", self.url_root),
+            ("/health", self.url_health),
+            ("/issues", self.url_issues),
+            ("/users", self.url_users)
+        ]
+        
+        # Only the status is checked; the bodies are still read in full so
+        # each connection goes back to the keep-alive pool, but never decoded
+        def fetch(url):
+            try:
+                return self.session.get(url)
+            except Exception as e:
+                return e
+        
+        results = self._gather(*(lambda url=url: fetch(url) for _, url in endpoints_to_test))
+        
+        all_passed = True
+        for (endpoint, _), response in zip(endpoints_to_test, results):
+            if isinstance(response, Exception):
+                all_passed = False
+                self.log_test("Backward Compatibility", False, f"Endpoint {endpoint} failed with exception: {str(response)}")
+                break
             
-            if all_passed:
-                self.log_test("Backward Compatibility", True, "All existing endpoints working correctly after image upload changes")
-                return True
-            else:
-                return False
-                
-        except Exception as e:
-            self.log_test("Backward Compatibility", False, f"Exception: {str(e)}")
+            if response.status_code not in [200, 201]:
+                all_passed = False
+                self.log_test("Backward Compatibility", False, f"Endpoint {endpoint} failed with status {response.status_code}")
+                break
+        
+        if all_passed:
+            self.log_test("Backward Compatibility", True, "All existing endpoints working correctly after image upload changes")
+            return True
+        else:
             return False
 
+    @log_exceptions("Enhanced Error Handling")
     def test_enhanced_error_handling(self):
         """Test enhanced error handling for various scenarios"""
-        try:
-            test_cases = [
-                # Test missing required fields
-                ({}, 400, "Empty request body"),
-                ({"description": "Test"}, 400, "Missing required fields"),
-                ({"user_id": "invalid", "description": "Test", "category": "Test", "location": "Test"}, 500, "Invalid user_id"),
-            ]
-            
-            all_passed = True
-            for test_data, expected_status, test_name in test_cases:
-                try:
-                    response = self.session.post(f"{self.base_url}/issues", json=test_data)
-                    
-                    if response.status_code == expected_status:
-                        continue  # This test case passed
-                    else:
-                        all_passed = False
-                        self.log_test("Enhanced Error Handling", False, f"{test_name}: Expected {expected_status}, got {response.status_code}")
-                        break
-                        
-                except Exception as e:
-                    all_passed = False
-                    self.log_test("Enhanced Error Handling", False, f"{test_name}: Exception {str(e)}")
-                    break
+        test_cases = [
+            # Test missing required fields
+            ({}, 400, "Empty request body"),
+            ({"description": "Test"}, 400, "Missing required fields"),
+            ({"user_id": "invalid", "description": "Test", "category": "Test", "location": "Test"}, 500, "Invalid user_id"),
+        ]
+        
+        def post(test_data):
+            try:
+                return self.session.post(self.url_issues, json=test_data)
+            except Exception as e:
+                return e
+        
+        responses = self._gather(*(lambda test_data=test_data: post(test_data) for test_data, _, _ in test_cases))
+        
+        all_passed = True
+        for (_, expected_status, test_name), response in zip(test_cases, responses):
+            if isinstance(response, Exception):
+                all_passed = False
+                self.log_test("Enhanced Error Handling", False, f"{test_name}: Exception {str(response)}")
+                break
             
-            if all_passed:
-                self.log_test("Enhanced Error Handling", True, "Error handling working correctly for various scenarios")
-                return True
-            else:
-                return False
-                
+            if response.status_code != expected_status:
+                all_passed = False
+                self.log_test("Enhanced Error Handling", False, f"{test_name}: Expected {expected_status}, got {response.status_code}")
+                break
+        
+        if all_passed:
+            self.log_test("Enhanced Error Handling", True, "Error handling working correctly for various scenarios")
+            return True
+        else:
+            return False
+
+    def _run_test(self, test):
+        """Run a single test, treating an escaped exception as a failure"""
+        try:
+            return bool(test())
         except Exception as e:
-            self.log_test("Enhanced Error Handling", False, f"Exception: {str(e)}")
+            with self._lock:
+                print(f"❌ Test {test.__name__} failed with exception: {e}", file=self._log_buf)
             return False
 
     def run_all_tests(self):
-        """Run all tests in sequence"""
+        """Run independent tests concurrently alongside the create/read/update chain"""
         print("🚀 Starting Civic Reporter Backend API Tests")
         print("=" * 60)
         
-        tests = [
+        # Fail fast if the backend is down instead of letting every test wait
+        # out its own connect timeout; the response is reused by the root test
+        try:
+            self.cached_get(self.url_root, timeout=GATE_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Backend unreachable at {BASE_URL}: {e}")
+            return False
+        
+        # None of these depend on data created by another test
+        independent_tests = [
             self.test_root_endpoint,
             self.test_health_endpoint,
             self.test_get_issues_empty,
             self.test_get_users_empty,
-            self.test_create_user,
-            self.test_create_issue,
-            self.test_create_issue_with_image,
-            self.test_create_issue_without_image,
-            self.test_get_specific_issue,
-            self.test_update_issue_status,
-            self.test_image_url_storage_and_retrieval,
             self.test_backward_compatibility,
             self.test_enhanced_error_handling,
-            self.test_cors_headers,
             self.test_error_handling
         ]
         
-        passed = 0
-        total = len(tests)
+        # Each stage needs the user or issues created by the stages before
+        # it; the tests within a stage are independent of one another
+        dependent_stages = [
+            [self.test_create_user],
+            [
+                self.test_create_issue,
+                self.test_create_issue_with_image,
+                self.test_create_issue_without_image
+            ],
+            [self.test_get_specific_issue],
+            [self.test_update_issue_status],
+            [self.test_image_url_storage_and_retrieval]
+        ]
         
-        for test in tests:
-            try:
-                if test():
-                    passed += 1
-                time.sleep(0.5)  # Small delay between tests
-            except Exception as e:
-                print(f"❌ Test {test.__name__} failed with exception: {e}")
+        results = []
+        if INTER_TEST_DELAY_MS > 0:
+            # Paced run: one test at a time, in chain order, with the pause
+            # between consecutive tests rather than inside concurrent workers
+            for test in independent_tests + [test for stage in dependent_stages for test in stage]:
+                results.append(self._run_test(test))
+                time.sleep(INTER_TEST_DELAY_MS / 1000)
+        else:
+            with ThreadPoolExecutor(max_workers=len(independent_tests)) as executor:
+                futures = [executor.submit(self._run_test, test) for test in independent_tests]
+                
+                # Run the dependent chain stage by stage on its own pool while
+                # the independent tests are in flight
+                with ThreadPoolExecutor(max_workers=max(map(len, dependent_stages))) as chain_executor:
+                    for stage in dependent_stages:
+                        results.extend(chain_executor.map(self._run_test, stage))
+                
+                for future in as_completed(futures):
+                    results.append(future.result())
+        
+        # CORS reuses the headers captured by the root endpoint test, so it
+        # runs once that has finished
+        results.append(self._run_test(self.test_cors_headers))
+        
+        passed = sum(results)
+        total = len(results)
+        
+        sys.stdout.write(self._log_buf.getvalue())
+        self._log_buf = io.StringIO()
         
         print("\n" + "=" * 60)
         print(f"📊 Test Results: {passed}/{total} tests passed")
@@ -547,8 +674,8 @@ class CivicReporterAPITester:
 
     def generate_summary(self):
         """Generate a summary of test results"""
-        passed = sum(1 for result in self.test_results if result['success'])
-        total = len(self.test_results)
+        passed = self._passed
+        total = self._total
         
         summary = {
             'total_tests': total,
@@ -556,14 +683,19 @@ class CivicReporterAPITester:
             'failed': total - passed,
             'success_rate': f"{(passed/total)*100:.1f}%" if total > 0 else "0%",
             'timestamp': datetime.now().isoformat(),
-            'test_details': self.test_results
+            'run_started': self._t0_wall.isoformat(),
+            'test_details_file': RESULTS_JSONL_PATH
         }
         
         return summary
 
 if __name__ == "__main__":
     tester = CivicReporterAPITester()
-    success = tester.run_all_tests()
+    try:
+        success = tester.run_all_tests()
+    finally:
+        # Results are flushed line by line; close the JSONL even if the run dies
+        tester._results_file.close()
     
     # Generate and save summary
     summary = tester.generate_summary()
@@ -576,7 +708,7 @@ if __name__ == "__main__":
     
     # Save detailed results to file
     with open('/app/test_results_detailed.json', 'w') as f:
-        json.dump(summary, f, indent=2)
+        f.write(json.dumps(summary, indent=2))
     
     print(f"\n📄 Detailed results saved to: /app/test_results_detailed.json")
     
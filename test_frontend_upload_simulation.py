@@ -4,30 +4,16 @@ Test Frontend Upload Simulation
 Simulates what happens when frontend tries to upload to non-existent bucket
 """
 
-import os
-import requests
+import types
 import json
 from datetime import datetime
+from axiom_test_config import SUPABASE_URL, SUPABASE_ANON_KEY, make_session
 
-# Load environment variables manually
-def load_env_vars():
-    env_vars = {}
-    try:
-        with open('/app/.env', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key] = value
-    except Exception as e:
-        print(f"Error loading .env file: {e}")
-    return env_vars
-
-env_vars = load_env_vars()
+# Upload headers are built once and shared read-only
+HEADERS_IMG = types.MappingProxyType({'Authorization': f'Bearer {SUPABASE_ANON_KEY}', 'Content-Type': 'image/jpeg'})
 
-# Supabase configuration
-SUPABASE_URL = env_vars.get('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_ANON_KEY = env_vars.get('NEXT_PUBLIC_SUPABASE_ANON_KEY')
+# Shared by both simulations so the second reuses the first's connection
+session = make_session()
 
 def test_upload_to_nonexistent_bucket():
     """Test what happens when trying to upload to non-existent bucket"""
@@ -35,16 +21,10 @@ def test_upload_to_nonexistent_bucket():
     
     # Simulate file upload
     storage_url = f"{SUPABASE_URL}/storage/v1/object/issue-photos/test-file.jpg"
-    headers = {
-        'Authorization': f'Bearer {SUPABASE_ANON_KEY}',
-        'Content-Type': 'image/jpeg'
-    }
-    
-    # Create a small test file content
-    test_file_content = b"fake image content for testing"
-    
     try:
-        response = requests.post(storage_url, headers=headers, data=test_file_content)
+        # An empty body is enough: the missing bucket is rejected by the
+        # upload route before any content would be read
+        response = session.post(storage_url, headers=HEADERS_IMG, data=b'')
         
         print(f"Upload Response Status: {response.status_code}")
         print(f"Upload Response: {response.text}")
@@ -73,7 +53,7 @@ def test_public_url_generation():
     print(f"Generated Public URL: {public_url}")
     
     try:
-        response = requests.head(public_url)
+        response = session.head(public_url)
         print(f"Public URL Response Status: {response.status_code}")
         
         if response.status_code == 404: